@@ -10,6 +10,8 @@ from PIL import Image
 from io import BytesIO
 import base64
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # NVIDIA API endpoints and authorization
 nvai_url = "https://ai.api.nvidia.com/v1/cv/nvidia/nv-grounding-dino"
@@ -18,10 +20,40 @@ neva_url = "https://ai.api.nvidia.com/v1/vlm/nvidia/neva-22b"
 header_auth = f"Bearer {st.secrets['NVIDIA_API_KEY']}"
 
 UPLOAD_ASSET_TIMEOUT = 300
-MAX_RETRIES = 5
+RESULT_TIMEOUT = UPLOAD_ASSET_TIMEOUT
 DELAY_BTW_RETRIES = 1
+MAX_RATE_LIMIT_RETRIES = 5
+PREFETCH_WORKERS = 4
+MAX_DISCARDED_PREFETCHES = 2
+TILE_SIZE = 1024
+TILE_OVERLAP = 128
+TILE_WORKERS = 4
+MAX_TILES = 64
+NMS_IOU_THRESHOLD = 0.5
+SEAM_MARGIN = 4
+SEAM_ALIGN_THRESHOLD = 0.5
 
-def _upload_asset(input_data, description):
+def _wait(delay, cancel=None):
+    if cancel is None:
+        time.sleep(delay)
+    elif cancel.wait(delay):
+        raise RuntimeError("Detection cancelled")
+
+def _request_with_backoff(method, url, cancel=None, **kwargs):
+    """Send a request, backing off exponentially while the service answers 429."""
+    delay = DELAY_BTW_RETRIES
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        if cancel is not None and cancel.is_set():
+            raise RuntimeError("Detection cancelled")
+        response = requests.request(method, url, **kwargs)
+        if response.status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+            return response
+        retry_after = response.headers.get("Retry-After", "")
+        _wait(int(retry_after) if retry_after.isdigit() else delay, cancel)
+        delay *= 2
+    return response
+
+def _upload_asset(input_data, description, cancel=None):
     assets_url = "https://api.nvcf.nvidia.com/v2/nvcf/assets"
     headers = {
         "Authorization": header_auth,
@@ -34,23 +66,333 @@ def _upload_asset(input_data, description):
     }
     payload = {"contentType": "image/jpeg", "description": description}
 
-    response = requests.post(assets_url, headers=headers, json=payload, timeout=60)
+    response = _request_with_backoff("POST", assets_url, cancel, headers=headers, json=payload, timeout=60)
     response.raise_for_status()
     asset_url = response.json()["uploadUrl"]
     asset_id = response.json()["assetId"]
 
-    response = requests.put(asset_url, data=input_data, headers=s3_headers, timeout=UPLOAD_ASSET_TIMEOUT)
+    response = _request_with_backoff(
+        "PUT", asset_url, cancel, data=input_data, headers=s3_headers, timeout=UPLOAD_ASSET_TIMEOUT
+    )
     response.raise_for_status()
 
     return uuid.UUID(asset_id)
 
+@st.cache_resource
+def _get_prefetch_executor():
+    return ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix="prefetch")
+
+def _upload_image(image, cancel=None):
+    img_bytes = BytesIO()
+    image.convert("RGB").save(img_bytes, format="JPEG")
+    return _upload_asset(img_bytes.getvalue(), "Input Image", cancel)
+
+def _encode_image_b64(image):
+    img_bytes = BytesIO()
+    image.save(img_bytes, format="PNG")
+    return base64.b64encode(img_bytes.getvalue()).decode()
+
+def prefetch_image(image_source, image, upload=True):
+    """Start uploading and encoding the image in the background and return its key.
+
+    Prefetches are keyed on the upload's file_id, so reruns for the same file
+    do no image work. The full-image upload is skipped when upload is False
+    and started on a later rerun once it is wanted. Work queued for a previous
+    image is cancelled; uploads that are already running cannot be
+    interrupted, so at most MAX_DISCARDED_PREFETCHES of them may be left in
+    flight before new prefetches are skipped.
+    """
+    image_key = image_source.file_id if image_source else None
+    current = st.session_state.prefetch
+    if current and current["key"] == image_key:
+        if upload and current["asset_id"] is None:
+            current["asset_id"] = _get_prefetch_executor().submit(_upload_image, image.copy())
+        return image_key
+
+    discarded = [f for f in st.session_state.discarded_prefetches if not f.done()]
+    if current:
+        for future in (current["asset_id"], current["image_b64"]):
+            if future and not future.cancel() and not future.done():
+                discarded.append(future)
+    st.session_state.discarded_prefetches = discarded
+    st.session_state.prefetch = None
+
+    if image and len(discarded) < MAX_DISCARDED_PREFETCHES:
+        # PIL images are not thread-safe, so each task works on its own copy
+        executor = _get_prefetch_executor()
+        st.session_state.prefetch = {
+            "key": image_key,
+            "asset_id": executor.submit(_upload_image, image.copy()) if upload else None,
+            "image_b64": executor.submit(_encode_image_b64, image.copy()),
+        }
+    return image_key
+
+def _prefetched_result(key, image_key, compute, image):
+    """Return the prefetched value for the image, computing it now on a miss or failure.
+
+    A prefetch that is still queued behind other uploads is cancelled and
+    computed inline rather than waited on.
+    """
+    current = st.session_state.prefetch
+    if current and current["key"] == image_key and current[key] and not current[key].cancel():
+        try:
+            return current[key].result()
+        except Exception:
+            pass
+    return compute(image)
+
+def _drop_prefetched(key, image_key):
+    """Discard a prefetched value that turned out to be unusable; return whether one was dropped."""
+    current = st.session_state.prefetch
+    if not (current and current["key"] == image_key and current[key]):
+        return False
+    future, current[key] = current[key], None
+    return future.done() and not future.cancelled() and future.exception() is None
+
+def detect_objects(image_key, image, prompt):
+    """Run Grounding Dino on the image and return the zipped result.
+
+    A prefetched asset that the service rejects, e.g. because it expired, is
+    dropped and the image is uploaded again for a single retry.
+    """
+    asset_id = _prefetched_result("asset_id", image_key, _upload_image, image)
+    try:
+        return _invoke_grounding_dino(asset_id, prompt)
+    except (requests.RequestException, RuntimeError):
+        if not _drop_prefetched("asset_id", image_key):
+            raise
+    return _invoke_grounding_dino(_upload_image(image), prompt)
+
+def _invoke_grounding_dino(asset_id, prompt, cancel=None):
+    """Run Grounding Dino on an uploaded asset and return the zipped result.
+
+    Setting the optional cancel event stops backoff and polling early.
+    """
+    inputs = {
+        "model": "Grounding-Dino",
+        "messages": [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": prompt},
+                    {"type": "media_url", "media_url": {"url": f"data:image/jpeg;asset_id,{asset_id}"}}
+                ]
+            }
+        ],
+        "threshold": 0.3
+    }
+
+    asset_list = f"{asset_id}"
+    headers = {
+        "Content-Type": "application/json",
+        "NVCF-INPUT-ASSET-REFERENCES": asset_list,
+        "NVCF-FUNCTION-ASSET-IDS": asset_list,
+        "Authorization": header_auth,
+    }
+
+    response = _request_with_backoff("POST", nvai_url, cancel, headers=headers, json=inputs)
+
+    if response.status_code == 202:
+        nvcf_reqid = response.headers['NVCF-REQID']
+        poll_url = nvai_polling_url + nvcf_reqid
+
+        deadline = time.monotonic() + RESULT_TIMEOUT
+        while response.status_code == 202:
+            if time.monotonic() >= deadline:
+                raise RuntimeError(f"Timed out after {RESULT_TIMEOUT}s waiting for the detection result")
+            _wait(DELAY_BTW_RETRIES, cancel)
+            headers_polling = {"accept": "application/json", "Authorization": header_auth}
+            response = _request_with_backoff("GET", poll_url, cancel, headers=headers_polling)
+
+    if response.status_code != 200:
+        raise RuntimeError(f"Error: {response.status_code}")
+    return response.content
+
+def _tile_origins(length, tile_size, overlap):
+    if length <= tile_size:
+        return [0]
+    stride = tile_size - overlap
+    origins = list(range(0, length - tile_size, stride))
+    origins.append(length - tile_size)
+    return origins
+
+def _plan_tiles(width, height):
+    """Return the tiled image size and tile origins, downscaling until at most MAX_TILES remain."""
+    scale = 1.0
+    while True:
+        size = (max(int(width * scale), 1), max(int(height * scale), 1))
+        origins = [
+            (left, top)
+            for top in _tile_origins(size[1], TILE_SIZE, TILE_OVERLAP)
+            for left in _tile_origins(size[0], TILE_SIZE, TILE_OVERLAP)
+        ]
+        if len(origins) <= MAX_TILES:
+            return size, origins
+        scale *= 0.9
+
+def _detect_tile(tile, prompt, cancel):
+    """Detect objects in a single tile and return (phrase, box, confidence) tuples."""
+    content = _invoke_grounding_dino(_upload_image(tile, cancel), prompt, cancel)
+
+    try:
+        with zipfile.ZipFile(BytesIO(content), "r") as z:
+            response_file = next((f for f in z.namelist() if f.endswith(".response")), None)
+            if response_file is None:
+                raise RuntimeError("Unexpected detection response for tile: no .response file in result")
+            result = json.loads(z.read(response_file))
+
+        detections = []
+        for entry in result["choices"][0]["message"]["content"]["boundingBoxes"]:
+            for box, confidence in zip(entry["bboxes"], entry["confidence"]):
+                detections.append((entry["phrase"], box, confidence))
+    except (zipfile.BadZipFile, json.JSONDecodeError, KeyError, IndexError, TypeError) as e:
+        raise RuntimeError(f"Unexpected detection response for tile: {e!r}") from e
+    return detections
+
+def _merge_seam_boxes(boxes, scores, labels, tiles, cut):
+    """Join partial boxes of one object that were cut apart at inner tile edges.
+
+    An object wider than the tile overlap crosses a seam and each tile only
+    reports its own part of it, so IoU between the parts stays low. Boxes of
+    the same label from different tiles are joined when they intersect, one
+    of them is cut at an inner tile edge, and they line up along the seam.
+    Returns the merged boxes, scores and labels.
+    """
+    x1, y1, x2, y2 = boxes.T
+    inter_w = np.minimum(x2[:, None], x2[None, :]) - np.maximum(x1[:, None], x1[None, :])
+    inter_h = np.minimum(y2[:, None], y2[None, :]) - np.maximum(y1[:, None], y1[None, :])
+    span_w = np.maximum(x2[:, None], x2[None, :]) - np.minimum(x1[:, None], x1[None, :])
+    span_h = np.maximum(y2[:, None], y2[None, :]) - np.minimum(y1[:, None], y1[None, :])
+
+    # Left/right cuts need the boxes to agree vertically, top/bottom cuts horizontally
+    cut_x = cut[:, [0, 2]].any(axis=1)
+    cut_y = cut[:, [1, 3]].any(axis=1)
+    aligned_y = inter_h / np.maximum(span_h, np.finfo(float).eps) >= SEAM_ALIGN_THRESHOLD
+    aligned_x = inter_w / np.maximum(span_w, np.finfo(float).eps) >= SEAM_ALIGN_THRESHOLD
+    adjacent = (
+        (labels[:, None] == labels[None, :])
+        & (tiles[:, None] != tiles[None, :])
+        & (inter_w > 0) & (inter_h > 0)
+        & (((cut_x[:, None] | cut_x[None, :]) & aligned_y) | ((cut_y[:, None] | cut_y[None, :]) & aligned_x))
+    )
+
+    # Connected components by propagating the smallest index through the adjacency matrix
+    component = np.arange(len(boxes))
+    while True:
+        neighbour_min = np.where(adjacent, component[None, :], len(boxes)).min(axis=1)
+        updated = np.minimum(component, neighbour_min)
+        if np.array_equal(updated, component):
+            break
+        component = updated
+
+    roots, component = np.unique(component, return_inverse=True)
+    merged = np.empty((len(roots), 4))
+    merged[:, :2] = np.inf
+    merged[:, 2:] = -np.inf
+    np.minimum.at(merged[:, 0], component, x1)
+    np.minimum.at(merged[:, 1], component, y1)
+    np.maximum.at(merged[:, 2], component, x2)
+    np.maximum.at(merged[:, 3], component, y2)
+    merged_scores = np.zeros(len(roots))
+    np.maximum.at(merged_scores, component, scores)
+    merged_labels = np.zeros(len(roots), dtype=int)
+    merged_labels[component] = labels
+    return merged, merged_scores, merged_labels
+
+def _batched_nms(boxes, scores, labels, iou_threshold):
+    """Vectorized per-label non-maximum suppression; returns the indices to keep."""
+    # Shift each label into its own coordinate range so boxes never overlap across labels
+    offsets = labels[:, None] * (boxes.max() + 1)
+    boxes = boxes + offsets
+    x1, y1, x2, y2 = boxes.T
+    areas = (x2 - x1) * (y2 - y1)
+    order = scores.argsort()[::-1]
+
+    keep = []
+    while order.size > 0:
+        i, rest = order[0], order[1:]
+        keep.append(i)
+        inter_w = np.clip(np.minimum(x2[i], x2[rest]) - np.maximum(x1[i], x1[rest]), 0, None)
+        inter_h = np.clip(np.minimum(y2[i], y2[rest]) - np.maximum(y1[i], y1[rest]), 0, None)
+        inter = inter_w * inter_h
+        union = np.maximum(areas[i] + areas[rest] - inter, np.finfo(float).eps)
+        iou = inter / union
+        order = rest[iou <= iou_threshold]
+    return np.array(keep, dtype=int)
+
+def detect_objects_tiled(image, prompt, tiled_size, origins):
+    """Detect objects over overlapping tiles concurrently and draw the merged boxes.
+
+    tiled_size and origins come from _plan_tiles. Partial boxes cut at tile
+    seams are joined first, then remaining duplicates are removed with NMS.
+    """
+    image = image.convert("RGB")
+    width, height = tiled_size
+    tiled_image = image.resize((width, height)) if (width, height) != image.size else image
+    scale_x, scale_y = image.width / width, image.height / height
+
+    cancel = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=TILE_WORKERS, thread_name_prefix="tile")
+    try:
+        futures = [
+            executor.submit(
+                _detect_tile,
+                tiled_image.crop((left, top, min(left + TILE_SIZE, width), min(top + TILE_SIZE, height))),
+                prompt,
+                cancel,
+            )
+            for left, top in origins
+        ]
+        tile_detections = [future.result() for future in futures]
+    except BaseException:
+        # Stop tiles that are still uploading or polling once any tile has failed
+        cancel.set()
+        raise
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    # Translate tile boxes back into global image coordinates, skipping zero-area boxes
+    # and recording which sides were cut off at an inner tile edge
+    phrases, boxes, scores, tiles, cut = [], [], [], [], []
+    for tile, ((left, top), detections) in enumerate(zip(origins, tile_detections)):
+        right, bottom = min(left + TILE_SIZE, width), min(top + TILE_SIZE, height)
+        for phrase, (x1, y1, x2, y2), confidence in detections:
+            if x2 <= x1 or y2 <= y1:
+                continue
+            phrases.append(phrase)
+            boxes.append([(x1 + left) * scale_x, (y1 + top) * scale_y,
+                          (x2 + left) * scale_x, (y2 + top) * scale_y])
+            scores.append(confidence)
+            tiles.append(tile)
+            cut.append([
+                left > 0 and x1 <= SEAM_MARGIN,
+                top > 0 and y1 <= SEAM_MARGIN,
+                right < width and x2 >= right - left - SEAM_MARGIN,
+                bottom < height and y2 >= bottom - top - SEAM_MARGIN,
+            ])
+
+    result = np.array(image)
+    if boxes:
+        names, labels = np.unique(phrases, return_inverse=True)
+        boxes, scores, labels = _merge_seam_boxes(
+            np.array(boxes, dtype=float),
+            np.array(scores, dtype=float),
+            labels,
+            np.array(tiles),
+            np.array(cut, dtype=bool),
+        )
+        for i in _batched_nms(boxes, scores, labels, NMS_IOU_THRESHOLD):
+            x1, y1, x2, y2 = boxes[i].astype(int)
+            cv2.rectangle(result, (x1, y1), (x2, y2), (118, 185, 0), 2)
+            cv2.putText(result, f"{names[labels[i]]} {scores[i]:.2f}", (x1, max(y1 - 5, 10)),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (118, 185, 0), 1)
+    return Image.fromarray(result)
+
 def capture_image_from_camera():
     st.text("Click to take a picture")
     camera_image = st.camera_input("Take a Picture")
     
-    if camera_image:
-        return Image.open(camera_image)
-    return None
+    return camera_image
 
 def get_image_description(image_b64, query):
     headers = {
@@ -103,6 +445,12 @@ if "detected_image" not in st.session_state:
     st.session_state.detected_image = None
 if "original_image" not in st.session_state:
     st.session_state.original_image = None
+if "original_key" not in st.session_state:
+    st.session_state.original_key = None
+if "prefetch" not in st.session_state:
+    st.session_state.prefetch = None
+if "discarded_prefetches" not in st.session_state:
+    st.session_state.discarded_prefetches = []
 
 # Home Tab
 if tab == "Home":
@@ -131,99 +479,68 @@ elif tab == "Processing":
     output_dir = "output"
     os.makedirs(output_dir, exist_ok=True)
 
-    camera_image = capture_image_from_camera()
+    camera_file = capture_image_from_camera()
+    tiled = st.checkbox("Tiled detection for large images (finds small objects in high-resolution inputs)")
 
-    if st.button("Detect Objects"):
-        image_to_analyze = None
+    # Start the upload and NEVA encoding as soon as an image is available
+    image_source = uploaded_image or camera_file
+    image_to_analyze = Image.open(image_source) if image_source else None
+    use_tiles = tiled and image_to_analyze and max(image_to_analyze.size) > TILE_SIZE
+    # Tiled detection uploads its own tiles, so skip the full-image upload
+    image_key = prefetch_image(image_source, image_to_analyze, upload=not use_tiles)
+
+    if use_tiles:
+        tiled_size, tile_origins = _plan_tiles(*image_to_analyze.size)
+        note = f" (downscaled to {tiled_size[0]}x{tiled_size[1]})" if tiled_size != image_to_analyze.size else ""
+        st.caption(f"Detection will run on {len(tile_origins)} tiles{note}.")
 
-        if uploaded_image:
-            image_to_analyze = Image.open(uploaded_image)
+    if st.button("Detect Objects"):
+        if image_to_analyze:
             st.session_state.original_image = image_to_analyze
-        elif camera_image:
-            image_to_analyze = camera_image
-            st.session_state.original_image = camera_image
+            st.session_state.original_key = image_key
         
         if image_to_analyze and prompt:
-            img_bytes = BytesIO()
-            image_to_analyze.save(img_bytes, format="JPEG")
-            img_bytes.seek(0)
-            asset_id = _upload_asset(img_bytes.read(), "Input Image")
-
-            inputs = {
-                "model": "Grounding-Dino",
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "text", "text": prompt},
-                            {"type": "media_url", "media_url": {"url": f"data:image/jpeg;asset_id,{asset_id}"}}
-                        ]
-                    }
-                ],
-                "threshold": 0.3
-            }
+            try:
+                if use_tiles:
+                    with st.spinner(f"Detecting objects across {len(tile_origins)} tiles..."):
+                        detected_image = detect_objects_tiled(image_to_analyze, prompt, tiled_size, tile_origins)
+                    image_file = f"Tiled detection ({len(tile_origins)} tiles)"
+                else:
+                    with st.spinner("Detecting objects..."):
+                        content = detect_objects(image_key, image_to_analyze, prompt)
 
-            asset_list = f"{asset_id}"
-            headers = {
-                "Content-Type": "application/json",
-                "NVCF-INPUT-ASSET-REFERENCES": asset_list,
-                "NVCF-FUNCTION-ASSET-IDS": asset_list,
-                "Authorization": header_auth,
-            }
+                    # Save and extract results
+                    with open(f"{output_dir}/output.zip", "wb") as out:
+                        out.write(content)
+
+                    with zipfile.ZipFile(f"{output_dir}/output.zip", "r") as z:
+                        z.extractall(output_dir)
 
-            response = requests.post(nvai_url, headers=headers, json=inputs)
-
-            if response.status_code in [200, 202]:
-                if response.status_code == 202:
-                    st.write("Processing...")
-                    nvcf_reqid = response.headers['NVCF-REQID']
-                    poll_url = nvai_polling_url + nvcf_reqid
-
-                    retries = MAX_RETRIES
-                    while retries > 0:
-                        headers_polling = {"accept": "application/json", "Authorization": header_auth}
-                        response_polling = requests.get(poll_url, headers=headers_polling)
-                        
-                        if response_polling.status_code == 202:
-                            st.write("Still processing...")
-                            retries -= 1
-                            time.sleep(DELAY_BTW_RETRIES)
-                        elif response_polling.status_code == 200:
-                            response = response_polling
-                            break
-                        else:
-                            st.error(f"Error: {response_polling.status_code}")
-                            break
-
-                # Save and extract results
-                with open(f"{output_dir}/output.zip", "wb") as out:
-                    out.write(response.content)
-
-                with zipfile.ZipFile(f"{output_dir}/output.zip", "r") as z:
-                    z.extractall(output_dir)
-
-                # Find and display the output image
-                image_file = next((f for f in os.listdir(output_dir) if f.endswith((".jpg", ".png"))), None)
+                    # Find the output image
+                    image_file = next((f for f in os.listdir(output_dir) if f.endswith((".jpg", ".png"))), None)
+                    detected_image = Image.open(os.path.join(output_dir, image_file)) if image_file else None
+            except (requests.RequestException, RuntimeError, zipfile.BadZipFile) as e:
+                st.error(str(e))
+                detected_image = None
+
+            if detected_image:
+                st.session_state.detected_image = detected_image
+                st.image(st.session_state.detected_image, caption="Detected Objects")
+                st.session_state.history.append({"file": image_file, "status": "Done"})
                 
-                if image_file:
-                    result_image_path = os.path.join(output_dir, image_file)
-                    st.session_state.detected_image = Image.open(result_image_path)
-                    st.image(st.session_state.detected_image, caption="Detected Objects")
-                    st.session_state.history.append({"file": image_file, "status": "Done"})
-                    
-                    # Modified download options with correct format handling
-                    download_format = st.radio("Choose download format", ["JPEG", "PNG"])
-                    img_bytes = BytesIO()
-                    st.session_state.detected_image.save(img_bytes, format=download_format)
-                    img_bytes.seek(0)
-                    
-                    # Use .jpg extension for JPEG format
-                    file_extension = "jpg" if download_format == "JPEG" else "png"
-                    st.download_button(
-                        f"Download {download_format}", 
-                        data=img_bytes, 
-                        file_name=f"result.{file_extension}"
-                    )
+                # Modified download options with correct format handling
+                download_format = st.radio("Choose download format", ["JPEG", "PNG"])
+                img_bytes = BytesIO()
+                st.session_state.detected_image.save(img_bytes, format=download_format)
+                img_bytes.seek(0)
+                
+                # Use .jpg extension for JPEG format
+                file_extension = "jpg" if download_format == "JPEG" else "png"
+                st.download_button(
+                    f"Download {download_format}", 
+                    data=img_bytes, 
+                    file_name=f"result.{file_extension}"
+                )
     # Query Section
     if st.session_state.detected_image:
         st.header("Step 2: Ask Questions")
@@ -231,14 +548,15 @@ elif tab == "Processing":
         
         if st.button("Get Answer"):
             if user_query:
-                # Convert image to base64
-                img_bytes = BytesIO()
-                st.session_state.original_image.save(img_bytes, format="PNG")
-                img_bytes.seek(0)
-                image_b64 = base64.b64encode(img_bytes.getvalue()).decode()
-
                 # Get and display the answer
                 with st.spinner("Processing your question..."):
+                    # Convert image to base64, reusing the prefetched encoding when available
+                    image_b64 = _prefetched_result(
+                        "image_b64",
+                        st.session_state.original_key,
+                        _encode_image_b64,
+                        st.session_state.original_image,
+                    )
                     result = get_image_description(image_b64, user_query)
                     st.subheader("Answer:")
                     st.write(result)